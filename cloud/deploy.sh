@@ -5,14 +5,16 @@
 #   1. Google Cloud SDK installed (gcloud)
 #   2. A GCP project with Cloud Run API enabled
 #   3. Trained model placed in cloud/model/pupil_segnet/
+#   4. For QUANTIZATION=int8, eye images (JPEG/PNG) in cloud/calibration/
 #
 # Usage:
-#   ./deploy.sh <PROJECT_ID> [REGION]
+#   [QUANTIZATION=int8] ./deploy.sh <PROJECT_ID> [REGION]
 
 set -euo pipefail
 
 PROJECT_ID="${1:?Usage: ./deploy.sh <PROJECT_ID> [REGION]}"
 REGION="${2:-us-central1}"
+QUANTIZATION="${QUANTIZATION:-fp16}"
 SERVICE_NAME="pupil-detection"
 IMAGE_NAME="gcr.io/${PROJECT_ID}/${SERVICE_NAME}"
 
@@ -20,6 +22,7 @@ echo "=== Pupil Detection Service Deployment ==="
 echo "Project: ${PROJECT_ID}"
 echo "Region:  ${REGION}"
 echo "Image:   ${IMAGE_NAME}"
+echo "Quant:   ${QUANTIZATION}"
 echo ""
 
 # Check model exists
@@ -29,6 +32,13 @@ if [ ! -d "model/pupil_segnet" ]; then
     exit 1
 fi
 
+# int8 quantization calibrates on sample eye images at startup
+if [ "${QUANTIZATION}" = "int8" ] && \
+    ! ls calibration/ 2>/dev/null | grep -qiE '\.(jpe?g|png)$'; then
+    echo "ERROR: QUANTIZATION=int8 needs calibration images in cloud/calibration/"
+    exit 1
+fi
+
 # Set project
 gcloud config set project "${PROJECT_ID}"
 
@@ -49,7 +59,7 @@ gcloud run deploy "${SERVICE_NAME}" \
     --min-instances 0 \
     --max-instances 5 \
     --allow-unauthenticated \
-    --set-env-vars "MODEL_PATH=./model/pupil_segnet"
+    --set-env-vars "MODEL_PATH=./model/pupil_segnet,QUANTIZATION=${QUANTIZATION}"
 
 # Get service URL
 SERVICE_URL=$(gcloud run services describe "${SERVICE_NAME}" \
@@ -10,19 +10,27 @@ Endpoints:
     GET  /health       - Health check
 """
 
+import asyncio
+import binascii
 import io
 import os
 import time
 import logging
+import math
+import zlib
 from contextlib import asynccontextmanager
 
 import cv2
 import numpy as np
+import orjson
 import tensorflow as tf
 from fastapi import FastAPI, File, UploadFile, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from turbojpeg import TurboJPEG, TJPF_BGR
 from typing import Optional
 
 logging.basicConfig(
@@ -34,7 +42,24 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 MODEL_PATH = os.environ.get("MODEL_PATH", "./model/pupil_segnet")
+# Weight quantization for the TFLite model: "fp16" (default) or "int8"
+QUANTIZATION = os.environ.get("QUANTIZATION", "fp16").lower()
+TFLITE_PATH = os.environ.get("TFLITE_PATH", f"/tmp/pupil_segnet_{QUANTIZATION}.tflite")
+# Eye images used to calibrate activation ranges for int8 quantization
+# (required when QUANTIZATION=int8)
+CALIBRATION_DIR = os.environ.get("CALIBRATION_DIR", "./calibration")
+CALIBRATION_SAMPLES = 100
+# Sample eye image run through the full pipeline at startup
+WARMUP_IMAGE = os.environ.get("WARMUP_IMAGE", "./warmup.jpg")
+NUM_THREADS = int(os.environ.get("NUM_THREADS", os.cpu_count() or 1))
 IMG_SIZE = 256
+# Circles are fitted on the class mask downsampled by this factor
+FIT_SCALE = 2
+FIT_SIZE = IMG_SIZE // FIT_SCALE
+# Dynamic batching: concurrent requests arriving within the timeout share
+# one model invocation of up to MAX_BATCH images
+MAX_BATCH = int(os.environ.get("MAX_BATCH", 4))
+BATCH_TIMEOUT_MS = float(os.environ.get("BATCH_TIMEOUT_MS", 5))
 NUM_CLASSES = 3
 PORT = int(os.environ.get("PORT", 8080))
 
@@ -44,30 +69,156 @@ ALLOWED_ORIGINS = os.environ.get(
     "https://bosonian.github.io,http://localhost:8000,http://127.0.0.1:8000"
 ).split(",")
 
-# Global model reference
-model = None
+# Global interpreters and tensor details (set once at startup). Each batch
+# size 1..MAX_BATCH gets its own interpreter with static shapes, mapped to
+# (interpreter, mask accessor), so tensors are never resized per request
+interpreters = {}
+model_input = None
+mask_output = None
+conf_output = None
+
+# Queue of (image, future) pairs drained by batch_worker, the only caller
+# of the interpreters once the service is up
+batch_queue = None
+# Preallocated model input batch, reused across invocations
+_batch_buf = None
 
 # Request counter for logging (no PII stored)
 request_count = 0
 
 
+def calibration_images() -> list:
+    """List up to CALIBRATION_SAMPLES image paths in CALIBRATION_DIR."""
+    if not os.path.isdir(CALIBRATION_DIR):
+        return []
+    paths = sorted(
+        os.path.join(CALIBRATION_DIR, name)
+        for name in os.listdir(CALIBRATION_DIR)
+        if name.lower().endswith((".jpg", ".jpeg", ".png"))
+    )
+    return paths[:CALIBRATION_SAMPLES]
+
+
+def representative_dataset_gen():
+    """Yield preprocessed eye images from CALIBRATION_DIR for int8 calibration."""
+    for path in calibration_images():
+        img = cv2.imread(path)
+        if img is None:
+            continue
+        resized = cv2.resize(img, (IMG_SIZE, IMG_SIZE))
+        yield [resized[np.newaxis, ...].astype(np.float32)]
+
+
+def convert_to_tflite(saved_model_path: str, tflite_path: str, quantization: str) -> None:
+    """
+    Convert the SavedModel to a quantized TFLite flatbuffer.
+
+    The model was trained on RGB images scaled to [0, 1]; a channel swap and
+    the 1/255 scaling are prepended to the graph so the converted model takes
+    OpenCV's BGR pixel values directly (an int8 model calibrated on images
+    spanning 0-255 then has an identity uint8 input quantization). The
+    softmax is reduced in-graph to two outputs: the (N, H, W) uint8 class
+    mask and (N, 2) mean [pupil, iris] confidence over the predicted pixels.
+    Spatial dimensions are fixed at IMG_SIZE; only the batch dimension is
+    left open and gets pinned per interpreter at startup.
+
+    Args:
+        saved_model_path: Directory of the exported SavedModel
+        tflite_path: Destination path for the .tflite file
+        quantization: "fp16" for float16 weights, "int8" for full integer
+            quantization with uint8 input/output (needs CALIBRATION_DIR)
+
+    Raises:
+        RuntimeError: int8 was requested without calibration images
+    """
+    if quantization == "int8" and not calibration_images():
+        raise RuntimeError(
+            f"QUANTIZATION=int8 needs calibration images in {CALIBRATION_DIR}"
+        )
+
+    saved_model = tf.saved_model.load(saved_model_path)
+    infer = saved_model.signatures["serving_default"]
+
+    @tf.function(input_signature=[tf.TensorSpec([None, IMG_SIZE, IMG_SIZE, 3], tf.float32)])
+    def serve_mask(x):
+        output = infer(x[..., ::-1] * (1.0 / 255.0))
+        probs = output[list(output.keys())[0]]
+        classes = tf.argmax(probs, axis=-1, output_type=tf.int32)
+        max_prob = tf.reduce_max(probs, axis=-1)
+
+        def mean_conf(class_id):
+            hit = tf.cast(tf.equal(classes, class_id), tf.float32)
+            total = tf.reduce_sum(max_prob * hit, axis=[1, 2])
+            return total / tf.maximum(tf.reduce_sum(hit, axis=[1, 2]), 1.0)
+
+        conf = tf.stack([mean_conf(2), mean_conf(1)], axis=-1)
+        return tf.cast(classes, tf.uint8), conf
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions(
+        [serve_mask.get_concrete_function()], saved_model
+    )
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == "int8":
+        converter.representative_dataset = representative_dataset_gen
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.uint8
+        converter.inference_output_type = tf.uint8
+    else:
+        converter.target_spec.supported_types = [tf.float16]
+    tflite_model = converter.convert()
+    with open(tflite_path, "wb") as f:
+        f.write(tflite_model)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Load model on startup."""
-    global model
-    logger.info(f"Loading model from {MODEL_PATH}")
+    """Load model and start the batching worker on startup."""
+    global model_input, mask_output, conf_output, batch_queue, _batch_buf
     try:
-        model = tf.saved_model.load(MODEL_PATH)
+        # Use a prebuilt flatbuffer if one is shipped, otherwise convert
+        if not os.path.exists(TFLITE_PATH):
+            logger.info(f"Converting {MODEL_PATH} to TFLite at {TFLITE_PATH}")
+            convert_to_tflite(MODEL_PATH, TFLITE_PATH, QUANTIZATION)
+        logger.info(
+            f"Loading TFLite model from {TFLITE_PATH} "
+            f"(batch 1-{MAX_BATCH}, {NUM_THREADS} threads)"
+        )
+        with open(TFLITE_PATH, "rb") as f:
+            model_content = f.read()
+        for n in range(1, MAX_BATCH + 1):
+            # XNNPACK is the default CPU delegate for float models
+            interpreter = tf.lite.Interpreter(model_content=model_content, num_threads=NUM_THREADS)
+            input_index = interpreter.get_input_details()[0]["index"]
+            interpreter.resize_tensor_input(input_index, [n, IMG_SIZE, IMG_SIZE, 3], strict=True)
+            interpreter.allocate_tensors()
+            model_input = interpreter.get_input_details()[0]
+            output_details = interpreter.get_output_details()
+            mask_output = next(d for d in output_details if len(d["shape"]) == 3)
+            conf_output = next(d for d in output_details if len(d["shape"]) == 2)
+            # Accessor returning a zero-copy view of the mask buffer
+            interpreters[n] = (interpreter, interpreter.tensor(mask_output["index"]))
+        _batch_buf = np.empty((MAX_BATCH, IMG_SIZE, IMG_SIZE, 3), dtype=model_input["dtype"])
         logger.info("Model loaded successfully")
-        # Warm up with a dummy inference
-        dummy = tf.constant(np.zeros((1, IMG_SIZE, IMG_SIZE, 3), dtype=np.float32))
-        _ = model.signatures["serving_default"](dummy)
+        batch_queue = asyncio.Queue()
+        worker = asyncio.create_task(batch_worker())
+        # Warm up decode, model and circle fitting end-to-end so the first
+        # request doesn't pay one-time initialization costs
+        if os.path.exists(WARMUP_IMAGE):
+            with open(WARMUP_IMAGE, "rb") as f:
+                warmup_bytes = f.read()
+            for _ in range(2):
+                await run_inference(warmup_bytes)
+        else:
+            logger.warning(f"Warmup image {WARMUP_IMAGE} not found, warming up model only")
+        for n in interpreters:
+            run_model([np.zeros((IMG_SIZE, IMG_SIZE, 3), dtype=np.uint8)] * n)
         logger.info("Model warmup complete")
     except Exception as e:
         logger.error(f"Failed to load model: {e}")
         raise
     yield
     logger.info("Shutting down")
+    worker.cancel()
 
 
 app = FastAPI(
@@ -83,8 +234,9 @@ app.add_middleware(
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=False,
     allow_methods=["POST", "GET", "OPTIONS"],
-    allow_headers=["Content-Type"],
+    allow_headers=["Content-Type", "Content-Encoding"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 @app.middleware("http")
@@ -92,9 +244,9 @@ async def log_requests(request: Request, call_next):
     """Log request metrics (no PII)."""
     global request_count
     request_count += 1
-    start = time.time()
+    start = time.perf_counter_ns()
     response = await call_next(request)
-    elapsed = round((time.time() - start) * 1000, 1)
+    elapsed = (time.perf_counter_ns() - start) / 1e6
     logger.info(
         "req=%d method=%s path=%s status=%d ms=%.1f",
         request_count,
@@ -106,7 +258,7 @@ async def log_requests(request: Request, call_next):
     return response
 
 
-# Response models
+# Response schemas (documentation only; handlers return plain dicts)
 class CircleResult(BaseModel):
     x: float
     y: float
@@ -127,9 +279,61 @@ class DetectionResponse(BaseModel):
     model_version: str = "1.0.0"
 
 
+# libjpeg-turbo handle for the JPEG fast path
+jpeg = TurboJPEG()
+
+# imdecode flags per downscale factor (libjpeg scales in the DCT domain)
+DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# JPEG start-of-frame markers carrying the image dimensions
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def read_image_size(image_bytes: bytes) -> Optional[tuple]:
+    """
+    Read (width, height) from a JPEG or PNG header without decoding.
+
+    Args:
+        image_bytes: Raw image bytes
+
+    Returns:
+        (width, height) tuple, or None for other formats or malformed headers
+    """
+    if image_bytes[:8] == b"\x89PNG\r\n\x1a\n" and len(image_bytes) >= 24:
+        return (
+            int.from_bytes(image_bytes[16:20], "big"),
+            int.from_bytes(image_bytes[20:24], "big"),
+        )
+    if image_bytes[:2] != b"\xff\xd8":
+        return None
+    i = 2
+    while i + 9 <= len(image_bytes):
+        if image_bytes[i] != 0xFF:
+            return None
+        marker = image_bytes[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            return (
+                int.from_bytes(image_bytes[i + 7:i + 9], "big"),
+                int.from_bytes(image_bytes[i + 5:i + 7], "big"),
+            )
+        i += 2 + int.from_bytes(image_bytes[i + 2:i + 4], "big")
+    return None
+
+
 def fit_circle_from_mask(mask: np.ndarray, class_id: int) -> Optional[dict]:
     """
-    Fit a circle to a segmentation mask region using contour analysis.
+    Fit a circle to a segmentation mask region using connected components.
+
+    Classes are nested (pupil inside iris), so the region for a class also
+    includes every higher class id; the iris disc covers the pupil.
 
     Args:
         mask: 2D predicted class array
@@ -138,73 +342,179 @@ def fit_circle_from_mask(mask: np.ndarray, class_id: int) -> Optional[dict]:
     Returns:
         Dict with x, y, radius or None
     """
-    binary = (mask == class_id).astype(np.uint8)
-    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    binary = (mask >= class_id).astype(np.uint8)
+    num, _, stats, centroids = cv2.connectedComponentsWithStats(binary, connectivity=8)
 
-    if not contours:
+    # Label 0 is the background
+    if num < 2:
         return None
 
-    largest = max(contours, key=cv2.contourArea)
-    if len(largest) < 5:
+    largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+    area = int(stats[largest, cv2.CC_STAT_AREA])
+    # Reject specks and thin strips that cannot be a disc
+    if min(stats[largest, cv2.CC_STAT_WIDTH], stats[largest, cv2.CC_STAT_HEIGHT]) < 3:
         return None
 
-    # Centroid from moments
-    M = cv2.moments(largest)
-    if M["m00"] > 0:
-        cx = M["m10"] / M["m00"]
-        cy = M["m01"] / M["m00"]
-    else:
-        (cx, cy), _ = cv2.minEnclosingCircle(largest)
+    cx, cy = centroids[largest]
 
-    # Effective radius from area
-    area = cv2.contourArea(largest)
-    radius = float(np.sqrt(area / np.pi))
+    # Effective radius from the component's pixel area; plain float math
+    # avoids NumPy's per-call overhead on a scalar
+    radius = math.sqrt(area / math.pi)
 
     return {"x": float(cx), "y": float(cy), "radius": radius}
 
 
-def run_inference(image_bytes: bytes) -> DetectionResponse:
+def preprocess_image(image_bytes: bytes) -> tuple:
     """
-    Full inference pipeline: decode image -> segment -> fit circles.
+    Decode an image and resize it to the model input.
 
     Args:
         image_bytes: Raw image bytes (JPEG/PNG)
 
     Returns:
-        DetectionResponse with detection results
+        (image, orig_w, orig_h) with image the (256, 256, 3) uint8 BGR input
+        in the interpreter's pixel domain
     """
-    start = time.time()
+    # cv2.imdecode asserts on an empty buffer
+    if not image_bytes:
+        raise HTTPException(status_code=400, detail="Could not decode image")
 
-    # Decode image
-    nparr = np.frombuffer(image_bytes, np.uint8)
-    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    # Decode image, downscaling large photos during decode as long as both
+    # sides stay at or above the model input size
+    size = read_image_size(image_bytes)
+    factor = 1
+    if size:
+        factor = next((f for f in (8, 4, 2) if min(size) // f >= IMG_SIZE), 1)
+    img = None
+    if image_bytes[:3] == b"\xff\xd8\xff" and image_bytes.find(b"Exif", 0, 64) < 0:
+        # TurboJPEG ignores EXIF orientation, so photos carrying EXIF use OpenCV
+        try:
+            img = jpeg.decode(
+                image_bytes,
+                pixel_format=TJPF_BGR,
+                scaling_factor=(1, factor) if factor > 1 else None,
+            )
+        except (OSError, ValueError):
+            # Fast path only: OpenCV handles e.g. CMYK JPEGs TurboJPEG rejects
+            img = None
+    if img is None:
+        nparr = np.frombuffer(image_bytes, np.uint8)
+        img = cv2.imdecode(nparr, DECODE_FLAGS[factor])
     if img is None:
         raise HTTPException(status_code=400, detail="Could not decode image")
 
-    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    orig_h, orig_w = img_rgb.shape[:2]
+    if size:
+        orig_w, orig_h = size
+        # imdecode applies EXIF orientation, which may swap the header dims
+        if (orig_w > orig_h) != (img.shape[1] > img.shape[0]):
+            orig_w, orig_h = orig_h, orig_w
+    else:
+        orig_h, orig_w = img.shape[:2]
+
+    # BGR is fed as-is; the model swaps channels and scales in-graph
+    resized = cv2.resize(img, (IMG_SIZE, IMG_SIZE))
+    if model_input["dtype"] == np.uint8:
+        in_scale, in_zero = model_input["quantization"]
+        if in_zero != 0 or abs(in_scale - 1.0) >= 1e-3:
+            # Calibration images did not span the full 0-255 range
+            q = resized.astype(np.float32) / in_scale + in_zero
+            resized = np.clip(np.rint(q), 0, 255).astype(np.uint8)
+
+    return resized, orig_w, orig_h
+
+
+def run_model(images: list) -> list:
+    """
+    Segment a batch of preprocessed images in one model invocation.
+
+    Args:
+        images: (256, 256, 3) uint8 inputs from preprocess_image
+
+    Returns:
+        List of (fit_mask, pupil_conf, iris_conf) per image, with fit_mask
+        the class mask downsampled to FIT_SIZE
+    """
+    n = len(images)
+    interpreter, mask_tensor = interpreters[n]
+
+    # Stacking into the input buffer also widens uint8 for float models
+    batch = np.stack(images, out=_batch_buf[:n])
+    interpreter.set_tensor(model_input["index"], batch)
+    interpreter.invoke()
+
+    conf = interpreter.get_tensor(conf_output["index"])  # (n, 2) [pupil, iris]
+    if conf_output["dtype"] == np.uint8:
+        # Dequantize mean softmax confidence
+        out_scale, out_zero = conf_output["quantization"]
+        conf = (conf.astype(np.float32) - out_zero) * out_scale
+
+    # Downsampling copies the masks out of the interpreter, which refuses
+    # to invoke while views into its buffers are alive
+    masks = mask_tensor()  # (n, 256, 256), view into the interpreter's buffer
+    fit_masks = [
+        cv2.resize(mask, (FIT_SIZE, FIT_SIZE), interpolation=cv2.INTER_NEAREST)
+        for mask in masks
+    ]
+    del masks
+
+    return [(fit_masks[i], float(conf[i, 0]), float(conf[i, 1])) for i in range(n)]
+
+
+async def batch_worker():
+    """Drain the queue in batches of up to MAX_BATCH and run the model."""
+    loop = asyncio.get_running_loop()
+    while True:
+        items = [await batch_queue.get()]
+        deadline = loop.time() + BATCH_TIMEOUT_MS / 1000
+        while len(items) < MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(batch_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            results = await run_in_threadpool(run_model, [image for image, _ in items])
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+        # Requests whose client went away have cancelled futures
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+
+async def run_inference(image_bytes: bytes) -> dict:
+    """
+    Full inference pipeline: decode image -> segment -> fit circles.
 
-    # Preprocess
-    resized = cv2.resize(img_rgb, (IMG_SIZE, IMG_SIZE))
-    normalized = resized.astype(np.float32) / 255.0
-    batch = tf.constant(normalized[np.newaxis, ...])
+    Decoding runs in the threadpool; segmentation goes through the batching
+    queue so concurrent requests share model invocations.
 
-    # Run model
-    infer = model.signatures["serving_default"]
-    output = infer(batch)
-    output_key = list(output.keys())[0]
-    pred = output[output_key].numpy()[0]  # (256, 256, 3)
+    Args:
+        image_bytes: Raw image bytes (JPEG/PNG)
 
-    # Get class predictions
-    pred_mask = np.argmax(pred, axis=-1).astype(np.uint8)
+    Returns:
+        Dict in the DetectionResponse schema with detection results
+    """
+    start = time.perf_counter_ns()
 
-    # Fit circles in model space
-    pupil_circle = fit_circle_from_mask(pred_mask, 2)
-    iris_circle = fit_circle_from_mask(pred_mask, 1)
+    image, orig_w, orig_h = await run_in_threadpool(preprocess_image, image_bytes)
+    future = asyncio.get_running_loop().create_future()
+    await batch_queue.put((image, future))
+    fit_mask, pupil_conf, iris_conf = await future
+
+    # Fit circles in the downsampled model space
+    pupil_circle = fit_circle_from_mask(fit_mask, 2)
+    iris_circle = fit_circle_from_mask(fit_mask, 1)
 
     # Scale to original image coordinates
-    scale_x = orig_w / IMG_SIZE
-    scale_y = orig_h / IMG_SIZE
+    scale_x = orig_w / FIT_SIZE
+    scale_y = orig_h / FIT_SIZE
     avg_scale = (scale_x + scale_y) / 2
 
     if pupil_circle:
@@ -217,30 +527,70 @@ def run_inference(image_bytes: bytes) -> DetectionResponse:
         iris_circle["y"] *= scale_y
         iris_circle["radius"] *= avg_scale
 
-    # Confidence from softmax probabilities
-    pupil_conf = float(np.mean(pred[..., 2][pred_mask == 2])) if np.any(pred_mask == 2) else 0.0
-    iris_conf = float(np.mean(pred[..., 1][pred_mask == 1])) if np.any(pred_mask == 1) else 0.0
-
     # Pupil-to-iris ratio
     ratio = None
     if pupil_circle and iris_circle and iris_circle["radius"] > 0:
         ratio = round(pupil_circle["radius"] / iris_circle["radius"], 4)
 
-    elapsed_ms = round((time.time() - start) * 1000, 1)
-
-    return DetectionResponse(
-        pupil=CircleResult(**pupil_circle) if pupil_circle else None,
-        iris=CircleResult(**iris_circle) if iris_circle else None,
-        confidence=ConfidenceResult(
-            pupil=round(pupil_conf, 3),
-            iris=round(iris_conf, 3),
-        ),
-        ratio=ratio,
-        inference_ms=elapsed_ms,
-    )
+    # Whole 0.1 ms steps in integer arithmetic
+    elapsed_ms = ((time.perf_counter_ns() - start) // 100_000) / 10
+
+    return {
+        "pupil": pupil_circle,
+        "iris": iris_circle,
+        "confidence": {
+            "pupil": round(float(pupil_conf), 3),
+            "iris": round(float(iris_conf), 3),
+        },
+        "ratio": ratio,
+        "inference_ms": elapsed_ms,
+        "model_version": "1.0.0",
+    }
+
+
+def decode_base64_image(image_b64: str) -> bytes:
+    """
+    Decode a base64 image, stripping a data URL prefix if present.
+
+    Args:
+        image_b64: Base64 string, optionally prefixed with "data:...;base64,"
+
+    Returns:
+        Raw image bytes
+    """
+    comma = image_b64.find(",")
+    if comma >= 0:
+        image_b64 = image_b64[comma + 1:]
+
+    try:
+        return binascii.a2b_base64(image_b64)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid base64 encoding")
 
 
-@app.post("/detect", response_model=DetectionResponse)
+def decompress_image(body: bytes) -> bytes:
+    """
+    Decompress a gzip request body, stopping just past the 10MB image limit.
+
+    Args:
+        body: gzip-compressed raw image bytes
+
+    Returns:
+        Raw image bytes (at most one byte over the limit, for the caller's
+        size check)
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        return decompressor.decompress(body, 10 * 1024 * 1024 + 1)
+    except zlib.error:
+        raise HTTPException(status_code=400, detail="Invalid gzip body")
+
+
+@app.post(
+    "/detect",
+    response_class=ORJSONResponse,
+    responses={200: {"model": DetectionResponse}},
+)
 async def detect_pupil(image: UploadFile = File(...)):
     """
     Detect pupil and iris from an uploaded eye image.
@@ -255,37 +605,46 @@ async def detect_pupil(image: UploadFile = File(...)):
     if len(contents) > 10 * 1024 * 1024:  # 10MB limit
         raise HTTPException(status_code=400, detail="Image too large (max 10MB)")
 
-    return run_inference(contents)
+    return await run_inference(contents)
 
 
-@app.post("/detect/base64", response_model=DetectionResponse)
-async def detect_pupil_base64(data: dict):
+@app.post(
+    "/detect/base64",
+    response_class=ORJSONResponse,
+    responses={200: {"model": DetectionResponse}},
+)
+async def detect_pupil_base64(request: Request):
     """
     Detect pupil and iris from a base64-encoded image.
 
     Accepts JSON body: {"image": "<base64-encoded-image>"}
     This endpoint is useful for PWA integration where the image
     is captured from canvas as a data URL.
-    """
-    import base64
 
-    image_b64 = data.get("image", "")
-    if not image_b64:
-        raise HTTPException(status_code=400, detail="Missing 'image' field")
+    With "Content-Encoding: gzip" the body is instead the gzip-compressed
+    raw image, which skips base64 and its ~33% size overhead.
+    """
+    body = await request.body()
+    if request.headers.get("content-encoding", "").lower() == "gzip":
+        if len(body) > 10 * 1024 * 1024:
+            raise HTTPException(status_code=400, detail="Image too large (max 10MB)")
+        image_bytes = await run_in_threadpool(decompress_image, body)
+    else:
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
 
-    # Strip data URL prefix if present
-    if "," in image_b64:
-        image_b64 = image_b64.split(",", 1)[1]
+        image_b64 = data.get("image") if isinstance(data, dict) else None
+        if not image_b64 or not isinstance(image_b64, str):
+            raise HTTPException(status_code=400, detail="Missing 'image' field")
 
-    try:
-        image_bytes = base64.b64decode(image_b64)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid base64 encoding")
+        image_bytes = await run_in_threadpool(decode_base64_image, image_b64)
 
     if len(image_bytes) > 10 * 1024 * 1024:
         raise HTTPException(status_code=400, detail="Image too large (max 10MB)")
 
-    return run_inference(image_bytes)
+    return await run_inference(image_bytes)
 
 
 @app.get("/health")
@@ -293,7 +652,7 @@ async def health_check():
     """Health check endpoint for Cloud Run."""
     return {
         "status": "healthy",
-        "model_loaded": model is not None,
+        "model_loaded": bool(interpreters),
         "model_path": MODEL_PATH,
         "requests_served": request_count,
         "version": "2.0.0",
@@ -41,12 +41,23 @@ const CloudDetection = (() => {
             throw new Error('Cloud detection not available');
         }
 
-        // Convert ImageData to base64 JPEG
+        // Encode ImageData as JPEG
         const canvas = document.createElement('canvas');
         canvas.width = width;
         canvas.height = height;
         canvas.getContext('2d').putImageData(imageData, 0, 0);
-        const dataUrl = canvas.toDataURL('image/jpeg', 0.85);
+
+        // Send gzip-compressed raw JPEG bytes where CompressionStream is
+        // supported, falling back to a base64 data URL in JSON
+        let headers, body;
+        if (typeof CompressionStream !== 'undefined') {
+            const jpeg = await new Promise(resolve => canvas.toBlob(resolve, 'image/jpeg', 0.85));
+            headers = { 'Content-Type': 'image/jpeg', 'Content-Encoding': 'gzip' };
+            body = await new Response(jpeg.stream().pipeThrough(new CompressionStream('gzip'))).blob();
+        } else {
+            headers = { 'Content-Type': 'application/json' };
+            body = JSON.stringify({ image: canvas.toDataURL('image/jpeg', 0.85) });
+        }
 
         const controller = new AbortController();
         const timeout = setTimeout(() => controller.abort(), CLOUD_TIMEOUT_MS);
@@ -54,8 +65,8 @@ const CloudDetection = (() => {
         try {
             const resp = await fetch(`${CLOUD_DETECT_URL}/detect/base64`, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ image: dataUrl }),
+                headers,
+                body,
                 signal: controller.signal
             });
             clearTimeout(timeout);